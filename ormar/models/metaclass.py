@@ -85,6 +85,12 @@ def add_cached_properties(new_model: Type["Model"]) -> None:
     new_model._related_names = None
     new_model._through_names = None
     new_model._related_fields = None
+    new_model._column_names_by_alias = None
+    new_model._default_providers = None
+    new_model._server_default_names = None
+    new_model._pk_removable = None
+    new_model._bytes_parsers = None
+    new_model._alias_pairs = None
     new_model._json_fields = set()
     new_model._bytes_fields = set()
 
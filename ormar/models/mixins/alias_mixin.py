@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 
 class AliasMixin:
@@ -10,6 +10,8 @@ class AliasMixin:
         from ormar.models.ormar_config import OrmarConfig
 
         ormar_config: OrmarConfig
+        _column_names_by_alias: Optional[Dict[str, str]]
+        _alias_pairs: Optional[Tuple[Tuple[str, str], ...]]
 
     @classmethod
     def get_column_alias(cls, field_name: str) -> str:
@@ -29,15 +31,21 @@ class AliasMixin:
         """
         Returns ormar field name for given db alias (column name in db).
         If field do not have alias it's returned as is.
+        Mapping is cached in cls._column_names_by_alias for quicker access,
+        as it's resolved for each column of each row fetched from the database.
         :param alias:
         :type alias: str
         :return: field name if set, otherwise passed alias (db name)
         :rtype: str
         """
-        for field_name, field in cls.ormar_config.model_fields.items():
-            if field.get_alias() == alias:
-                return field_name
-        return alias  # if not found it's not an alias but actual name
+        names_by_alias = cls._column_names_by_alias
+        if names_by_alias is None:
+            names_by_alias = {}
+            for field_name, field in cls.ormar_config.model_fields.items():
+                names_by_alias.setdefault(field.get_alias(), field_name)
+            cls._column_names_by_alias = names_by_alias
+        # if not found it's not an alias but actual name
+        return names_by_alias.get(alias, alias)
 
     @classmethod
     def translate_columns_to_aliases(cls, new_kwargs: Dict) -> Dict:
@@ -50,11 +58,29 @@ class AliasMixin:
         :return: dict with aliases and their values
         :rtype: Dict
         """
-        for field_name, field in cls.ormar_config.model_fields.items():
+        for field_name, alias in cls._get_alias_pairs():
             if field_name in new_kwargs:
-                new_kwargs[field.get_alias()] = new_kwargs.pop(field_name)
+                new_kwargs[alias] = new_kwargs.pop(field_name)
         return new_kwargs
 
+    @classmethod
+    def _get_alias_pairs(cls) -> Tuple[Tuple[str, str], ...]:
+        """
+        Returns pairs of field names and db aliases for fields which alias
+        is different than the field name.
+        Pairs are cached in cls._alias_pairs for quicker access,
+        as they are used for each saved model.
+        :return: pairs of field names and their aliases
+        :rtype: Tuple[Tuple[str, str], ...]
+        """
+        if cls._alias_pairs is None:
+            cls._alias_pairs = tuple(
+                (field_name, field.get_alias())
+                for field_name, field in cls.ormar_config.model_fields.items()
+                if field.get_alias() != field_name
+            )
+        return cls._alias_pairs
+
     @classmethod
     def translate_aliases_to_columns(cls, new_kwargs: Dict) -> Dict:
         """
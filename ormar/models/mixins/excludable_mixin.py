@@ -110,14 +110,15 @@ class ExcludableMixin(RelationMixin):
         :rtype: List[str]
         """
         model_excludable = excludable.get(model_cls=model, alias=alias)  # type: ignore
-        columns = [
-            model.get_column_name_from_alias(col.name) if not use_alias else col.name
-            for col in model.ormar_config.table.columns
-        ]
         field_names = [
             model.get_column_name_from_alias(col.name)
             for col in model.ormar_config.table.columns
         ]
+        columns = (
+            [col.name for col in model.ormar_config.table.columns]
+            if use_alias
+            else field_names[:]
+        )
         if model_excludable.include:
             columns = [
                 col
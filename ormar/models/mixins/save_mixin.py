@@ -10,6 +10,7 @@ from typing import (
     List,
     Optional,
     Set,
+    Tuple,
     cast,
 )
 
@@ -37,6 +38,10 @@ class SavePrepareMixin(RelationMixin, AliasMixin):
         _bytes_fields: Set[str]
         __pydantic_core_schema__: CoreSchema
         __ormar_fields_validators__: Optional[Dict[str, SchemaValidator]]
+        _default_providers: Optional[Tuple[Tuple[str, Callable[..., Any]], ...]]
+        _server_default_names: Optional[Tuple[str, ...]]
+        _pk_removable: Optional[bool]
+        _bytes_parsers: Optional[Tuple[Tuple[str, Callable[[str], bytes]], ...]]
 
     @classmethod
     def prepare_model_to_save(cls, new_kwargs: dict) -> dict:
@@ -96,8 +101,9 @@ class SavePrepareMixin(RelationMixin, AliasMixin):
         :return: dictionary of model that is about to be saved
         :rtype: Dict[str, str]
         """
-        ormar_fields = {k for k, v in cls.ormar_config.model_fields.items()}
-        new_kwargs = {k: v for k, v in new_kwargs.items() if k in ormar_fields}
+        ormar_fields = cls.ormar_config.model_fields
+        for key in [k for k in new_kwargs if k not in ormar_fields]:
+            del new_kwargs[key]
         return new_kwargs
 
     @classmethod
@@ -112,11 +118,11 @@ class SavePrepareMixin(RelationMixin, AliasMixin):
         :rtype: Dict[str, str]
         """
         pkname = cls.ormar_config.pkname
-        pk = cls.ormar_config.model_fields[pkname]
-        if new_kwargs.get(pkname, ormar.Undefined) is None and (
-            pk.nullable or pk.autoincrement
-        ):
-            del new_kwargs[pkname]
+        if cls._pk_removable is None:
+            pk = cls.ormar_config.model_fields[pkname]
+            cls._pk_removable = bool(pk.nullable or pk.autoincrement)
+        if cls._pk_removable and new_kwargs.get(pkname) is None:
+            new_kwargs.pop(pkname, None)
         return new_kwargs
 
     @classmethod
@@ -184,20 +190,35 @@ class SavePrepareMixin(RelationMixin, AliasMixin):
         :return: dictionary of model that is about to be saved
         :rtype: Dict
         """
-        bytes_base64_fields = {
-            name
-            for name, field in cls.ormar_config.model_fields.items()
-            if field.represent_as_base64_str
-        }
-        for key, value in model_dict.items():
-            if key in cls._bytes_fields and isinstance(value, str):
-                model_dict[key] = (
-                    value.encode("utf-8")
-                    if key not in bytes_base64_fields
-                    else base64.b64decode(value)
-                )
+        for field_name, parser in cls._get_bytes_parsers():
+            value = model_dict.get(field_name)
+            if isinstance(value, str):
+                model_dict[field_name] = parser(value)
         return model_dict
 
+    @classmethod
+    def _get_bytes_parsers(cls) -> Tuple[Tuple[str, Callable[[str], bytes]], ...]:
+        """
+        Returns pairs of bytes fields names and functions converting their string
+        representation back into bytes (base64 decoding or utf-8 encoding).
+
+        Pairs are cached in cls._bytes_parsers for quicker access,
+        as they are used for each saved model.
+
+        :return: bytes fields names with their parsers
+        :rtype: Tuple[Tuple[str, Callable[[str], bytes]], ...]
+        """
+        if cls._bytes_parsers is None:
+            model_fields = cls.ormar_config.model_fields
+            bytes_parsers: List[Tuple[str, Callable[[str], bytes]]] = []
+            for name in cls._bytes_fields.intersection(model_fields):
+                if model_fields[name].represent_as_base64_str:
+                    bytes_parsers.append((name, base64.b64decode))
+                else:
+                    bytes_parsers.append((name, str.encode))  # utf-8 by default
+            cls._bytes_parsers = tuple(bytes_parsers)
+        return cls._bytes_parsers
+
     @classmethod
     def dump_all_json_fields_to_str(cls, model_dict: Dict) -> Dict:
         """
@@ -226,17 +247,44 @@ class SavePrepareMixin(RelationMixin, AliasMixin):
         :return: dictionary of model that is about to be saved
         :rtype: Dict
         """
-        for field_name, field in cls.ormar_config.model_fields.items():
-            if field_name not in new_kwargs and field.has_default(use_server=False):
-                new_kwargs[field_name] = field.get_default()
-            # clear fields with server_default set as None
-            if (
-                field.server_default is not None
-                and new_kwargs.get(field_name, None) is None
-            ):
+        default_providers, server_default_names = cls._get_default_providers()
+        for field_name, get_default in default_providers:
+            if field_name not in new_kwargs:
+                new_kwargs[field_name] = get_default()
+        # clear fields with server_default set as None
+        for field_name in server_default_names:
+            if new_kwargs.get(field_name, None) is None:
                 new_kwargs.pop(field_name, None)
         return new_kwargs
 
+    @classmethod
+    def _get_default_providers(
+        cls,
+    ) -> Tuple[Tuple[Tuple[str, Callable[..., Any]], ...], Tuple[str, ...]]:
+        """
+        Returns pairs of field names and their default getters for fields with
+        (not server) default set, and names of the fields with server_default set.
+
+        Both are cached in cls._default_providers and cls._server_default_names
+        for quicker access, as they are used for each saved model.
+
+        :return: default value getters and names of fields with server default
+        :rtype: Tuple[Tuple[Tuple[str, Callable], ...], Tuple[str, ...]]
+        """
+        if cls._default_providers is None or cls._server_default_names is None:
+            model_fields = cls.ormar_config.model_fields
+            cls._default_providers = tuple(
+                (field_name, field.get_default)
+                for field_name, field in model_fields.items()
+                if field.has_default(use_server=False)
+            )
+            cls._server_default_names = tuple(
+                field_name
+                for field_name, field in model_fields.items()
+                if field.server_default is not None
+            )
+        return cls._default_providers, cls._server_default_names
+
     @classmethod
     def validate_enums(cls, new_kwargs: Dict) -> Dict:
         """
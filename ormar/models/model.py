@@ -60,7 +60,8 @@ class Model(ModelRow):
 
         If there are fields with server_default set and those fields
         are not already filled save will trigger also a second query
-        to refreshed the fields populated server side.
+        to refreshed the fields populated server side. On backends supporting
+        RETURNING (postgres) the fields are returned by the insert itself.
 
         Does not recognize if model was previously saved.
         If you want to perform update or insert depending on the pk
@@ -82,34 +83,49 @@ class Model(ModelRow):
         ):
             self_fields.pop(self.ormar_config.pkname, None)
         self_fields = self.populate_default_values(self_fields)
+        related_names = self.extract_related_names()
         self.update_from_dict(
-            {
-                k: v
-                for k, v in self_fields.items()
-                if k not in self.extract_related_names()
-            }
+            {k: v for k, v in self_fields.items() if k not in related_names}
         )
 
         self_fields = self.translate_columns_to_aliases(self_fields)
         expr = self.ormar_config.table.insert()
         expr = expr.values(**self_fields)
 
-        pk = await self.ormar_config.database.execute(expr)
-        if pk and isinstance(pk, self.pk_type()):
-            setattr(self, self.ormar_config.pkname, pk)
-
-        self.set_save_status(True)
         # refresh server side defaults
-        if any(
+        refresh_required = any(
             field.server_default is not None
             for name, field in self.ormar_config.model_fields.items()
             if name not in self_fields
-        ):
-            await self.load()
+        )
+        if refresh_required and self._database_supports_returning():
+            # return whole inserted row instead of reloading it in second query
+            expr = expr.returning(*self.ormar_config.table.columns)
+            row = await self.ormar_config.database.fetch_one(expr)
+            self._update_from_row(row)
+        else:
+            pk = await self.ormar_config.database.execute(expr)
+            if pk and isinstance(pk, self.pk_type()):
+                setattr(self, self.ormar_config.pkname, pk)
+
+            self.set_save_status(True)
+            if refresh_required:
+                await self.load()
 
         await self.signals.post_save.send(sender=self.__class__, instance=self)
         return self
 
+    def _database_supports_returning(self) -> bool:
+        """
+        Checks if dialect of the model database can return inserted row columns
+        with RETURNING clause.
+
+        :return: result of the check
+        :rtype: bool
+        """
+        dialect = self.ormar_config.database._backend._dialect
+        return bool(getattr(dialect, "full_returning", False))
+
     async def save_related(  # noqa: CCR001, CFQ002
         self,
         follow: bool = False,
@@ -294,11 +310,20 @@ class Model(ModelRow):
         row = await self.ormar_config.database.fetch_one(expr)
         if not row:  # pragma nocover
             raise NoMatch("Instance was deleted from database and cannot be refreshed")
-        kwargs = dict(row)
-        kwargs = self.translate_aliases_to_columns(kwargs)
+        self._update_from_row(row)
+        return self
+
+    def _update_from_row(self, row: Any) -> None:
+        """
+        Updates model fields with values of the database row
+        and marks the model as saved.
+
+        :param row: row fetched from the model table
+        :type row: sqlalchemy.engine.result.Row
+        """
+        kwargs = self.translate_aliases_to_columns(dict(row))
         self.update_from_dict(kwargs)
         self.set_save_status(True)
-        return self
 
     async def load_all(
         self: T,
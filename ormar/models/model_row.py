@@ -367,8 +367,10 @@ class ModelRow(NewBaseModel):
         and values are database values
         :rtype: Dict
         """
-        selected_columns = cls.own_table_columns(
-            model=cls, excludable=excludable, alias=table_prefix, use_alias=False
+        selected_columns = set(
+            cls.own_table_columns(
+                model=cls, excludable=excludable, alias=table_prefix, use_alias=False
+            )
         )
 
         column_prefix = table_prefix + "_" if table_prefix else ""
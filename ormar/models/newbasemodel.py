@@ -5,6 +5,7 @@ from typing import (
     TYPE_CHECKING,
     AbstractSet,
     Any,
+    Callable,
     Dict,
     List,
     Literal,
@@ -87,6 +88,12 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         _related_names: Optional[Set]
         _through_names: Optional[Set]
         _related_names_hash: str
+        _column_names_by_alias: Optional[Dict[str, str]]
+        _default_providers: Optional[Tuple[Tuple[str, Callable[..., Any]], ...]]
+        _server_default_names: Optional[Tuple[str, ...]]
+        _pk_removable: Optional[bool]
+        _bytes_parsers: Optional[Tuple[Tuple[str, Callable[[str], bytes]], ...]]
+        _alias_pairs: Optional[Tuple[Tuple[str, str], ...]]
         _quick_access_fields: Set
         _json_fields: Set
         _bytes_fields: Set
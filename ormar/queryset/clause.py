@@ -39,6 +39,22 @@ class FilterGroup:
         self._kwargs_dict = kwargs
         self.actions: List[FilterAction] = []
 
+    @classmethod
+    def from_resolved(cls, clauses: List[Any]) -> "FilterGroup":
+        """
+        Creates and group out of already resolved clauses. FilterGroups become
+        nested groups and FilterActions become own actions of the new group.
+
+        :param clauses: list of resolved filter actions and filter groups
+        :type clauses: List[Union[FilterAction, FilterGroup]]
+        :return: resolved group joining given clauses with and
+        :rtype: FilterGroup
+        """
+        group = cls(*[x for x in clauses if isinstance(x, FilterGroup)])
+        group.actions = [x for x in clauses if not isinstance(x, FilterGroup)]
+        group._resolved = True
+        return group
+
     def __and__(self, other: "FilterGroup") -> "FilterGroup":
         return FilterGroup(self, other)
 
@@ -26,12 +26,14 @@ class FilterQuery:
         :rtype: sqlalchemy.sql.selectable.Select
         """
         if self.filter_clauses:
-            if len(self.filter_clauses) == 1:
-                clause = self.filter_clauses[0].get_text_clause()
+            clauses = [x.get_text_clause() for x in self.filter_clauses]
+            if self.exclude:
+                # each exclude clause negated separately, conditions passed in one
+                # exclude call are grouped in a single clause
+                clauses = [sqlalchemy.sql.not_(x) for x in clauses]
+            if len(clauses) == 1:
+                clause = clauses[0]
             else:
-                clause = sqlalchemy.sql.and_(
-                    *[x.get_text_clause() for x in self.filter_clauses]
-                )
-            clause = sqlalchemy.sql.not_(clause) if self.exclude else clause
+                clause = sqlalchemy.sql.and_(*clauses)
             expr = expr.where(clause)
         return expr
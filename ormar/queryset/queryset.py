@@ -1,9 +1,12 @@
 import asyncio
+import functools
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncGenerator,
+    Callable,
     Dict,
+    FrozenSet,
     Generic,
     List,
     Optional,
@@ -19,6 +22,9 @@ from typing import (
 import databases
 import sqlalchemy
 from sqlalchemy import bindparam
+from sqlalchemy import exists as _sa_exists
+from sqlalchemy import func as _sa_func
+from sqlalchemy import literal_column as _sa_literal_column
 
 try:
     from sqlalchemy.engine import LegacyRow
@@ -36,6 +42,7 @@ from ormar.exceptions import (
     ModelPersistenceError,
     QueryDefinitionError,
 )
+from ormar.models.helpers.models import group_related_list
 from ormar.queryset import FieldAccessor, FilterQuery, SelectAction
 from ormar.queryset.actions.order_action import OrderAction
 from ormar.queryset.clause import FilterGroup, QueryClause
@@ -51,12 +58,64 @@ if TYPE_CHECKING:  # pragma no cover
 else:
     T = TypeVar("T", bound="Model")
 
+# bound once as count is used by each count query
+_count_func = _sa_func.count
+
+
+_slot_names_by_class: Dict[type, Tuple[str, ...]] = {}
+
+
+def _queryset_slot_names(cls: type) -> Tuple[str, ...]:
+    """
+    Collects names of the slots declared on given QuerySet class and all its
+    base classes, so custom queryset classes with own __slots__ keep their
+    attributes when the queryset is copied. Names are cached per class.
+
+    :param cls: QuerySet class or its subclass
+    :type cls: type
+    :return: names of slot attributes (with private names mangled)
+    :rtype: Tuple[str, ...]
+    """
+    cached = _slot_names_by_class.get(cls)
+    if cached is not None:
+        return cached
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{klass.__name__.lstrip('_')}{name}"
+            names.append(name)
+    slot_names = _slot_names_by_class[cls] = tuple(dict.fromkeys(names))
+    return slot_names
+
 
 class QuerySet(Generic[T]):
     """
     Main class to perform database queries, exposed on each model as objects attribute.
     """
 
+    __slots__ = (
+        "proxy_source_model",
+        "model_cls",
+        "filter_clauses",
+        "exclude_clauses",
+        "_select_related",
+        "_prefetch_related",
+        "limit_count",
+        "query_offset",
+        "_excludable",
+        "order_bys",
+        "limit_sql_raw",
+        "_model_config",
+        "_database",
+        "_table",
+        "_pkname",
+        "_self_fields_names",
+    )
+
     def __init__(  # noqa CFQ002
         self,
         model_cls: Optional[Type["T"]] = None,
@@ -82,6 +141,13 @@ class QuerySet(Generic[T]):
         self._excludable = excludable or ormar.ExcludableItems()
         self.order_bys = order_bys or []
         self.limit_sql_raw = limit_raw_sql
+        # config lookups are repeated in each query method, resolve them once
+        config = getattr(model_cls, "ormar_config", None)
+        self._model_config = cast("OrmarConfig", config)
+        self._database = cast(databases.Database, getattr(config, "database", None))
+        self._table = cast(sqlalchemy.Table, getattr(config, "table", None))
+        self._pkname = cast(str, getattr(config, "pkname", None))
+        self._self_fields_names: Optional[FrozenSet[str]] = None
 
     @property
     def model_config(self) -> "OrmarConfig":
@@ -91,9 +157,9 @@ class QuerySet(Generic[T]):
         :return: OrmarConfig of the model
         :rtype: model's OrmarConfig
         """
-        if not self.model_cls:  # pragma nocover
+        if not self._model_config:  # pragma nocover
             raise ValueError("Model class of QuerySet is not initialized")
-        return self.model_cls.ormar_config
+        return self._model_config
 
     @property
     def model(self) -> Type["T"]:
@@ -124,33 +190,44 @@ class QuerySet(Generic[T]):
         Method that returns new instance of queryset based on passed params,
         all not passed params are taken from current values.
         """
-        overwrites = {
-            "select_related": "_select_related",
-            "offset": "query_offset",
-            "excludable": "_excludable",
-            "prefetch_related": "_prefetch_related",
-            "limit_raw_sql": "limit_sql_raw",
+        changes = {
+            "filter_clauses": filter_clauses,
+            "exclude_clauses": exclude_clauses,
+            "_select_related": select_related,
+            "limit_count": limit_count,
+            "query_offset": offset,
+            "_excludable": excludable,
+            "order_bys": order_bys,
+            "_prefetch_related": prefetch_related,
+            "limit_sql_raw": limit_raw_sql,
+            "proxy_source_model": proxy_source_model,
         }
-        passed_args = locals()
-
-        def replace_if_none(arg_name: str) -> Any:
-            if passed_args.get(arg_name) is None:
-                return getattr(self, overwrites.get(arg_name, arg_name))
-            return passed_args.get(arg_name)
-
-        return self.__class__(
-            model_cls=self.model_cls,
-            filter_clauses=replace_if_none("filter_clauses"),
-            exclude_clauses=replace_if_none("exclude_clauses"),
-            select_related=replace_if_none("select_related"),
-            limit_count=replace_if_none("limit_count"),
-            offset=replace_if_none("offset"),
-            excludable=replace_if_none("excludable"),
-            order_bys=replace_if_none("order_bys"),
-            prefetch_related=replace_if_none("prefetch_related"),
-            limit_raw_sql=replace_if_none("limit_raw_sql"),
-            proxy_source_model=replace_if_none("proxy_source_model"),
-        )
+        return self._replace(**{k: v for k, v in changes.items() if v is not None})
+
+    def _replace(self, **changes: Any) -> "QuerySet[T]":
+        """
+        Returns a copy of the queryset with given attributes replaced.
+
+        Attributes of existing queryset are already normalized, so __init__ is
+        skipped and all values are copied over as they are, which makes chaining
+        the queryset methods cheap.
+
+        :param changes: names of QuerySet attributes and their new values
+        :type changes: Any
+        :return: new QuerySet instance
+        :rtype: QuerySet
+        """
+        cls = self.__class__
+        queryset = cls.__new__(cls)
+        for name in _queryset_slot_names(cls):
+            if hasattr(self, name):
+                setattr(queryset, name, getattr(self, name))
+        # subclasses without __slots__ can keep their own attributes in __dict__
+        if hasattr(self, "__dict__"):
+            queryset.__dict__.update(self.__dict__)
+        for name, value in changes.items():
+            setattr(queryset, name, value)
+        return queryset
 
     async def _prefetch_related_models(
         self, models: List["T"], rows: List
@@ -174,6 +251,26 @@ class QuerySet(Generic[T]):
         )
         return await query.prefetch_related(models=models)  # type: ignore
 
+    def _build_row_decoder(self) -> Callable[..., Optional["Model"]]:
+        """
+        Resolves the parameters shared by all rows of one query result
+        (nested related models structure, excludable, source models) once,
+        and binds them to from_row so each row is decoded with a single call.
+
+        :return: callable converting one raw database row into a Model
+        :rtype: Callable
+        """
+        related_models = (
+            group_related_list(self._select_related[:]) if self._select_related else []
+        )
+        return functools.partial(
+            self.model.from_row,
+            related_models=related_models,
+            excludable=self._excludable,
+            source_model=self.model,
+            proxy_source_model=self.proxy_source_model,
+        )
+
     async def _process_query_result_rows(self, rows: List) -> List["T"]:
         """
         Process database rows and initialize ormar Model from each of the rows.
@@ -183,23 +280,73 @@ class QuerySet(Generic[T]):
         :return: list of models
         :rtype: List[Model]
         """
+        decode_row = self._build_row_decoder()
         result_rows = []
         for row in rows:
-            result_rows.append(
-                self.model.from_row(
-                    row=row,
-                    select_related=self._select_related,
-                    excludable=self._excludable,
-                    source_model=self.model,
-                    proxy_source_model=self.proxy_source_model,
-                )
-            )
+            result_rows.append(decode_row(row))
             await asyncio.sleep(0)
 
-        if result_rows:
+        if result_rows and self._joins_to_many_relations(
+            self.model, tuple(self._select_related)
+        ):
             return self.model.merge_instances_list(result_rows)  # type: ignore
         return cast(List["T"], result_rows)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _joins_to_many_relations(
+        model_cls: Type["Model"], select_related: Tuple[str, ...]
+    ) -> bool:
+        """
+        Checks if any of the select_related paths follows a to-many relation
+        (ManyToMany or reverse side of ForeignKey).
+
+        Only such joins can return multiple rows for one main model, so if all
+        joined relations are to-one each row is already a unique model and
+        merging instances can be skipped. Result is cached as it depends only
+        on the model and related paths.
+
+        :param model_cls: main model of the query
+        :type model_cls: Type[Model]
+        :param select_related: related models paths joined in the query
+        :type select_related: Tuple[str, ...]
+        :return: result of the check
+        :rtype: bool
+        """
+        for related in select_related:
+            target = model_cls
+            for part in related.split("__"):
+                field = target.ormar_config.model_fields.get(part)
+                if field is None or not field.is_valid_uni_relation():
+                    return True
+                target = field.to
+        return False
+
+    async def _fetch_single_model(self, expr: sqlalchemy.sql.select) -> "T":
+        """
+        Fetches one row of the query that does not join related models and
+        initializes ormar Model from it.
+
+        As without select_related each row is one model, merging instances is not
+        needed, and the row can be fetched with fetch_one instead of fetch_all.
+
+        :raises NoMatch: if no row is returned
+        :param expr: select expression returning at most one model row
+        :type expr: sqlalchemy.sql.select
+        :return: returned model
+        :rtype: Model
+        """
+        row = await self._database.fetch_one(expr)
+        instance = self._build_row_decoder()(row) if row is not None else None
+        if instance is None:
+            raise NoMatch()
+        if self._prefetch_related:
+            prefetched = await self._prefetch_related_models(
+                [cast("T", instance)], [row]
+            )
+            instance = prefetched[0]
+        return cast("T", instance)
+
     def _resolve_filter_groups(
         self, groups: Any
     ) -> Tuple[List[FilterGroup], List[str]]:
@@ -239,9 +386,10 @@ class QuerySet(Generic[T]):
         :param rows: one element list of Models
         :type rows: List[Model]
         """
-        if not rows or rows[0] is None:
+        rows_count = len(rows)
+        if not rows_count or rows[0] is None:
             raise NoMatch()
-        if len(rows) > 1:
+        if rows_count > 1:
             raise MultipleMatches()
 
     @property
@@ -252,7 +400,7 @@ class QuerySet(Generic[T]):
         :return: database
         :rtype: databases.Database
         """
-        return self.model_config.database
+        return self._database
 
     @property
     def table(self) -> sqlalchemy.Table:
@@ -262,7 +410,24 @@ class QuerySet(Generic[T]):
         :return: database table
         :rtype: sqlalchemy.Table
         """
-        return self.model_config.table
+        return self._table
+
+    @property
+    def _self_fields(self) -> FrozenSet[str]:
+        """
+        Names of model own db fields and relation fields that can be updated.
+        Calculated on first use and cached on the QuerySet.
+
+        :return: names of fields that can be updated
+        :rtype: FrozenSet[str]
+        """
+        if self._self_fields_names is None:
+            self._self_fields_names = frozenset(
+                self.model.extract_db_own_fields().union(
+                    self.model.extract_related_names()
+                )
+            )
+        return self._self_fields_names
 
     def build_select_expression(
         self,
@@ -298,9 +463,123 @@ class QuerySet(Generic[T]):
         # print("\n", exp.compile(compile_kwargs={"literal_binds": True}))
         return exp
 
-    def filter(  # noqa: A003
-        self, *args: Any, _exclude: bool = False, **kwargs: Any
-    ) -> "QuerySet[T]":
+    def _apply_filter_clauses(
+        self, expr: Any, filter_clauses: Optional[List] = None
+    ) -> Any:
+        """
+        Applies the QuerySet filter and exclude clauses directly to given expression,
+        without building joins, ordering and pagination of the full select query.
+        If filter_clauses are not passed the QuerySet own value is used.
+
+        :param expr: select, update or delete expression on model table
+        :type expr: Any
+        :param filter_clauses: filter clauses to apply instead of own ones
+        :type filter_clauses: Optional[List]
+        :return: expression with where clauses applied
+        :rtype: Any
+        """
+        if filter_clauses is None:
+            filter_clauses = self.filter_clauses
+        expr = FilterQuery(filter_clauses=filter_clauses).apply(expr)
+        return FilterQuery(filter_clauses=self.exclude_clauses, exclude=True).apply(
+            expr
+        )
+
+    def _is_main_table_only_query(self) -> bool:
+        """
+        Checks if query touches only the main model table - so no related models
+        are joined and neither limit nor offset is applied. Such queries can be run
+        directly on the table, as each row is exactly one main model.
+
+        :return: result of the check
+        :rtype: bool
+        """
+        return (
+            not self._select_related
+            and self.limit_count is None
+            and not self.query_offset
+        )
+
+    def _is_pk_only_lookup(self, kwargs: Dict[str, Any]) -> bool:
+        """
+        Checks if given kwargs are a single lookup by primary key value and
+        the queryset has no other filters, joins or prefetches set, so the row
+        can be fetched directly by pk without parsing the filter clauses.
+
+        :param kwargs: filter kwargs passed to the query method
+        :type kwargs: Dict[str, Any]
+        :return: result of the check
+        :rtype: bool
+        """
+        if len(kwargs) != 1:
+            return False
+        key, value = next(iter(kwargs.items()))
+        return (
+            key in ("pk", self._pkname)
+            and value is not None
+            and not self.filter_clauses
+            and not self.exclude_clauses
+            and not self._prefetch_related
+            and self._is_main_table_only_query()
+        )
+
+    async def _get_by_pk(self, pk: Any) -> "T":
+        """
+        Fetches single model by primary key value straight from the model table.
+
+        As lookup by pk matches at most one row there is no need to build
+        the full select expression with ordering or check for multiple matches.
+
+        :raises NoMatch: if no row is returned
+        :param pk: value of the primary key (or model instance)
+        :type pk: Any
+        :return: returned model
+        :rtype: Model
+        """
+        if isinstance(pk, ormar.Model):
+            pk = pk.pk
+        columns = self.model.own_table_columns(
+            model=self.model, excludable=self._excludable, use_alias=True
+        )
+        pk_column = self._table.c[self.model.get_column_alias(self._pkname)]
+        expr = sqlalchemy.sql.select(
+            self.model_config.alias_manager.prefixed_columns("", self._table, columns)
+        )
+        expr = expr.select_from(self._table).where(pk_column == pk)
+        return await self._fetch_single_model(expr)
+
+    def _with_filters(
+        self,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        base_clauses: Optional[List] = None,
+    ) -> Tuple[List, List[str]]:
+        """
+        Resolves filter groups and keyword filters into filter clauses, without
+        constructing the new QuerySet.
+        If base_clauses are not passed the QuerySet own filter clauses are used.
+
+        :param args: filter groups passed to the query method
+        :type args: Tuple[Any, ...]
+        :param kwargs: fields names and proper value types
+        :type kwargs: Dict[str, Any]
+        :param base_clauses: already set clauses extended with the new ones
+        :type base_clauses: Optional[List]
+        :return: base clauses extended with new ones and updated select related
+        :rtype: Tuple[List, List[str]]
+        """
+        filter_groups, select_related = self._resolve_filter_groups(groups=args)
+        qryclause = QueryClause(
+            model_cls=self.model,
+            select_related=select_related,
+            filter_clauses=(
+                base_clauses if base_clauses is not None else self.filter_clauses
+            ),
+        )
+        filter_clauses, select_related = qryclause.prepare_filter(**kwargs)
+        return filter_clauses + filter_groups, select_related
+
+    def filter(self, *args: Any, **kwargs: Any) -> "QuerySet[T]":  # noqa: A003
         """
         Allows you to filter by any `Model` attribute/field
         as well as to fetch instances, with a filter across an FK relationship.
@@ -325,32 +604,14 @@ class QuerySet(Generic[T]):
 
         Note that you can also use python style filters - check the docs!
 
-        :param _exclude: flag if it should be exclude or filter
-        :type _exclude: bool
         :param kwargs: fields names and proper value types
         :type kwargs: Any
         :return: filtered QuerySet
         :rtype: QuerySet
         """
-        filter_groups, select_related = self._resolve_filter_groups(groups=args)
-        qryclause = QueryClause(
-            model_cls=self.model,
-            select_related=select_related,
-            filter_clauses=self.filter_clauses,
-        )
-        filter_clauses, select_related = qryclause.prepare_filter(**kwargs)
-        filter_clauses = filter_clauses + filter_groups  # type: ignore
-        if _exclude:
-            exclude_clauses = filter_clauses
-            filter_clauses = self.filter_clauses
-        else:
-            exclude_clauses = self.exclude_clauses
-            filter_clauses = filter_clauses
-
-        return self.rebuild_self(
-            filter_clauses=filter_clauses,
-            exclude_clauses=exclude_clauses,
-            select_related=select_related,
+        filter_clauses, select_related = self._with_filters(args, kwargs)
+        return self._replace(
+            filter_clauses=filter_clauses, _select_related=select_related
         )
 
     def exclude(self, *args: Any, **kwargs: Any) -> "QuerySet[T]":  # noqa: A003
@@ -367,12 +628,25 @@ class QuerySet(Generic[T]):
         `exclude(name='John', age>=35)` will become
         `where not (name='John' and age>=35)`
 
+        Each call is negated separately, so `exclude(name='John').exclude(age>=35)`
+        will become `where not name='John' and not age>=35`
+
         :param kwargs: fields names and proper value types
         :type kwargs: Any
         :return: filtered QuerySet
         :rtype: QuerySet
         """
-        return self.filter(_exclude=True, *args, **kwargs)
+        exclude_clauses, select_related = self._with_filters(
+            args, kwargs, base_clauses=self.exclude_clauses
+        )
+        new_clauses = exclude_clauses[len(self.exclude_clauses) :]
+        if len(new_clauses) > 1:
+            # keep conditions of one call together to negate them as a whole
+            group = FilterGroup.from_resolved(new_clauses)
+            exclude_clauses = exclude_clauses[: len(self.exclude_clauses)] + [group]
+        return self._replace(
+            exclude_clauses=exclude_clauses, _select_related=select_related
+        )
 
     def select_related(self, related: Union[List, str, FieldAccessor]) -> "QuerySet[T]":
         """
@@ -398,8 +672,8 @@ class QuerySet(Generic[T]):
             for rel in related
         ]
 
-        related = sorted(list(set(list(self._select_related) + related)))
-        return self.rebuild_self(select_related=related)
+        related = sorted({*self._select_related, *related})
+        return self._replace(_select_related=related)
 
     def select_all(self, follow: bool = False) -> "QuerySet[T]":
         """
@@ -425,7 +699,7 @@ class QuerySet(Generic[T]):
         relations = list(self.model.extract_related_names())
         if follow:
             relations = self.model._iterate_related_models()
-        return self.rebuild_self(select_related=relations)
+        return self._replace(_select_related=relations)
 
     def prefetch_related(
         self, related: Union[List, str, FieldAccessor]
@@ -454,8 +728,9 @@ class QuerySet(Generic[T]):
             for rel in related
         ]
 
-        related = list(set(list(self._prefetch_related) + related))
-        return self.rebuild_self(prefetch_related=related)
+        # keep the order in which relations were requested
+        related = list(dict.fromkeys([*self._prefetch_related, *related]))
+        return self._replace(_prefetch_related=related)
 
     def fields(
         self, columns: Union[List, str, Set, Dict], _is_exclude: bool = False
@@ -511,7 +786,7 @@ class QuerySet(Generic[T]):
             is_exclude=_is_exclude,
         )
 
-        return self.rebuild_self(excludable=excludable)
+        return self._replace(_excludable=excludable)
 
     def exclude_fields(self, columns: Union[List, str, Set, Dict]) -> "QuerySet[T]":
         """
@@ -587,7 +862,7 @@ class QuerySet(Generic[T]):
         ]
 
         order_bys = self.order_bys + [x for x in orders_by if x not in self.order_bys]
-        return self.rebuild_self(order_bys=order_bys)
+        return self._replace(order_bys=order_bys)
 
     async def values(
         self,
@@ -619,7 +894,7 @@ class QuerySet(Generic[T]):
                 _as_dict=_as_dict, _flatten=_flatten, exclude_through=exclude_through
             )
         expr = self.build_select_expression()
-        rows = await self.database.fetch_all(expr)
+        rows = await self._database.fetch_all(expr)
         if not rows:
             return []
         alias_resolver = ReverseAliasResolver(
@@ -684,9 +959,13 @@ class QuerySet(Generic[T]):
         :return: result of the check
         :rtype: bool
         """
+        if self._is_main_table_only_query():
+            expr = sqlalchemy.select([_sa_literal_column("1")])
+            expr = self._apply_filter_clauses(expr.select_from(self._table)).limit(1)
+            return await self._database.fetch_val(expr) is not None
         expr = self.build_select_expression()
-        expr = sqlalchemy.exists(expr).select()
-        return await self.database.fetch_val(expr)
+        expr = _sa_exists(expr).select()
+        return await self._database.fetch_val(expr)
 
     async def count(self, distinct: bool = True) -> int:
         """
@@ -704,16 +983,20 @@ class QuerySet(Generic[T]):
         :return: number of rows
         :rtype: int
         """
+        if self._is_main_table_only_query():
+            # without joins each row is a distinct main model, no subquery needed
+            expr = _count_func().select().select_from(self._table)
+            return await self._database.fetch_val(self._apply_filter_clauses(expr))
         expr = self.build_select_expression().alias("subquery_for_count")
-        expr = sqlalchemy.func.count().select().select_from(expr)
+        expr = _count_func().select().select_from(expr)
         if distinct:
-            pk_column_name = self.model.get_column_alias(self.model_config.pkname)
+            pk_column_name = self.model.get_column_alias(self._pkname)
             expr_distinct = expr.group_by(pk_column_name).alias("subquery_for_group")
-            expr = sqlalchemy.func.count().select().select_from(expr_distinct)
-        return await self.database.fetch_val(expr)
+            expr = _count_func().select().select_from(expr_distinct)
+        return await self._database.fetch_val(expr)
 
     async def _query_aggr_function(self, func_name: str, columns: List) -> Any:
-        func = getattr(sqlalchemy.func, func_name)
+        func = getattr(_sa_func, func_name)
         select_actions = [
             SelectAction(select_str=column, model_cls=self.model) for column in columns
         ]
@@ -726,7 +1009,7 @@ class QuerySet(Generic[T]):
         expr = self.build_select_expression().alias(f"subquery_for_{func_name}")
         expr = sqlalchemy.select(select_columns).select_from(expr)
         # print("\n", expr.compile(compile_kwargs={"literal_binds": True}))
-        result = await self.database.fetch_one(expr)
+        result = await self._database.fetch_one(expr)
         return dict(result) if len(result) > 1 else result[0]  # type: ignore
 
     async def max(self, columns: Union[str, List[str]]) -> Any:  # noqa: A003
@@ -797,20 +1080,12 @@ class QuerySet(Generic[T]):
                 "If you want to update all rows use update(each=True, **kwargs)"
             )
 
-        self_fields = self.model.extract_db_own_fields().union(
-            self.model.extract_related_names()
-        )
-        updates = {k: v for k, v in kwargs.items() if k in self_fields}
+        updates = {k: v for k, v in kwargs.items() if k in self._self_fields}
         updates = self.model.validate_enums(updates)
         updates = self.model.translate_columns_to_aliases(updates)
 
-        expr = FilterQuery(filter_clauses=self.filter_clauses).apply(
-            self.table.update().values(**updates)
-        )
-        expr = FilterQuery(filter_clauses=self.exclude_clauses, exclude=True).apply(
-            expr
-        )
-        return await self.database.execute(expr)
+        expr = self._apply_filter_clauses(self._table.update().values(**updates))
+        return await self._database.execute(expr)
 
     async def delete(self, *args: Any, each: bool = False, **kwargs: Any) -> int:
         """
@@ -826,20 +1101,20 @@ class QuerySet(Generic[T]):
         :return: number of deleted rows
         :rtype:int
         """
-        if kwargs or args:
-            return await self.filter(*args, **kwargs).delete()
-        if not each and not (self.filter_clauses or self.exclude_clauses):
+        filter_clauses = (
+            self._with_filters(args, kwargs)[0]
+            if kwargs or args
+            else self.filter_clauses
+        )
+        if not each and not (filter_clauses or self.exclude_clauses):
             raise QueryDefinitionError(
                 "You cannot delete without filtering the queryset first. "
                 "If you want to delete all rows use delete(each=True)"
             )
-        expr = FilterQuery(filter_clauses=self.filter_clauses).apply(
-            self.table.delete()
+        expr = self._apply_filter_clauses(
+            self._table.delete(), filter_clauses=filter_clauses
         )
-        expr = FilterQuery(filter_clauses=self.exclude_clauses, exclude=True).apply(
-            expr
-        )
-        return await self.database.execute(expr)
+        return await self._database.execute(expr)
 
     def paginate(self, page: int, page_size: int = 20) -> "QuerySet[T]":
         """
@@ -858,7 +1133,7 @@ class QuerySet(Generic[T]):
 
         limit_count = page_size
         query_offset = (page - 1) * page_size
-        return self.rebuild_self(limit_count=limit_count, offset=query_offset)
+        return self._replace(limit_count=limit_count, query_offset=query_offset)
 
     def limit(
         self, limit_count: int, limit_raw_sql: Optional[bool] = None
@@ -877,7 +1152,7 @@ class QuerySet(Generic[T]):
         :rtype: QuerySet
         """
         limit_raw_sql = self.limit_sql_raw if limit_raw_sql is None else limit_raw_sql
-        return self.rebuild_self(limit_count=limit_count, limit_raw_sql=limit_raw_sql)
+        return self._replace(limit_count=limit_count, limit_sql_raw=limit_raw_sql)
 
     def offset(
         self, offset: int, limit_raw_sql: Optional[bool] = None
@@ -896,7 +1171,7 @@ class QuerySet(Generic[T]):
         :rtype: QuerySet
         """
         limit_raw_sql = self.limit_sql_raw if limit_raw_sql is None else limit_raw_sql
-        return self.rebuild_self(offset=offset, limit_raw_sql=limit_raw_sql)
+        return self._replace(query_offset=offset, limit_sql_raw=limit_raw_sql)
 
     async def first(self, *args: Any, **kwargs: Any) -> "T":
         """
@@ -917,7 +1192,7 @@ class QuerySet(Generic[T]):
             order_bys=(
                 [
                     OrderAction(
-                        order_str=f"{self.model.ormar_config.pkname}",
+                        order_str=f"{self._pkname}",
                         model_cls=self.model_cls,  # type: ignore
                     )
                 ]
@@ -926,7 +1201,9 @@ class QuerySet(Generic[T]):
             )
             + self.order_bys,
         )
-        rows = await self.database.fetch_all(expr)
+        if not self._select_related:
+            return await self._fetch_single_model(expr)
+        rows = await self._database.fetch_all(expr)
         processed_rows = await self._process_query_result_rows(rows)
         if self._prefetch_related and processed_rows:
             processed_rows = await self._prefetch_related_models(processed_rows, rows)
@@ -989,6 +1266,8 @@ class QuerySet(Generic[T]):
         :rtype: Model
         """
         if kwargs or args:
+            if not args and self._is_pk_only_lookup(kwargs):
+                return await self._get_by_pk(next(iter(kwargs.values())))
             return await self.filter(*args, **kwargs).get()
 
         if not self.filter_clauses:
@@ -997,7 +1276,7 @@ class QuerySet(Generic[T]):
                 order_bys=(
                     [
                         OrderAction(
-                            order_str=f"-{self.model.ormar_config.pkname}",
+                            order_str=f"-{self._pkname}",
                             model_cls=self.model_cls,  # type: ignore
                         )
                     ]
@@ -1006,10 +1285,12 @@ class QuerySet(Generic[T]):
                 )
                 + self.order_bys,
             )
+            if not self._select_related:
+                return await self._fetch_single_model(expr)
         else:
             expr = self.build_select_expression()
 
-        rows = await self.database.fetch_all(expr)
+        rows = await self._database.fetch_all(expr)
         processed_rows = await self._process_query_result_rows(rows)
         if self._prefetch_related and processed_rows:
             processed_rows = await self._prefetch_related_models(processed_rows, rows)
@@ -1039,11 +1320,11 @@ class QuerySet(Generic[T]):
         :return: model instance and a boolean
         :rtype: Tuple("T", bool)
         """
-        try:
-            return await self.get(*args, **kwargs), False
-        except NoMatch:
-            _defaults = _defaults or {}
-            return await self.create(**{**kwargs, **_defaults}), True
+        instance = await self.get_or_none(*args, **kwargs)
+        if instance is not None:
+            return instance, False
+        _defaults = _defaults or {}
+        return await self.create(**{**kwargs, **_defaults}), True
 
     async def update_or_create(self, **kwargs: Any) -> "T":
         """
@@ -1054,7 +1335,7 @@ class QuerySet(Generic[T]):
         :return: updated or created model
         :rtype: Model
         """
-        pk_name = self.model_config.pkname
+        pk_name = self._pkname
         if "pk" in kwargs:
             kwargs[pk_name] = kwargs.pop("pk")
         if pk_name not in kwargs or kwargs.get(pk_name) is None:
@@ -1080,7 +1361,7 @@ class QuerySet(Generic[T]):
             return await self.filter(*args, **kwargs).all()
 
         expr = self.build_select_expression()
-        rows = await self.database.fetch_all(expr)
+        rows = await self._database.fetch_all(expr)
         result_rows = await self._process_query_result_rows(rows)
         if self._prefetch_related and result_rows:
             result_rows = await self._prefetch_related_models(result_rows, rows)
@@ -1120,9 +1401,9 @@ class QuerySet(Generic[T]):
 
         rows: list = []
         last_primary_key = None
-        pk_alias = self.model.get_column_alias(self.model_config.pkname)
+        pk_alias = self.model.get_column_alias(self._pkname)
 
-        async for row in self.database.iterate(query=expr):
+        async for row in self._database.iterate(query=expr):
             current_primary_key = row[pk_alias]
             if last_primary_key == current_primary_key or last_primary_key is None:
                 last_primary_key = current_primary_key
@@ -1176,12 +1457,46 @@ class QuerySet(Generic[T]):
 
         # don't use execute_many, as in databases it's executed in a loop
         # instead of using execute_many from drivers
-        expr = self.table.insert().values(ready_objects)
-        await self.database.execute(expr)
+        expr = self._table.insert().values(ready_objects)
+        await self._database.execute(expr)
 
         for obj in objects:
             obj.set_save_status(True)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _build_bulk_update_expression(
+        model_cls: Type["Model"], columns: Tuple[str, ...]
+    ) -> str:
+        """
+        Builds the update by primary key statement used in bulk_update.
+
+        Statement depends only on the model and updated columns, so compiled
+        string is cached and reused by subsequent bulk updates.
+
+        :param model_cls: model which table is updated
+        :type model_cls: Type[Model]
+        :param columns: db names of columns to update (including pk)
+        :type columns: Tuple[str, ...]
+        :return: compiled update statement with new_ prefixed bind params
+        :rtype: str
+        """
+        table = model_cls.ormar_config.table
+        pk_column_name = model_cls.get_column_alias(model_cls.ormar_config.pkname)
+        pk_column = table.c.get(pk_column_name)
+        table_columns = [c.name for c in table.c]
+        expr = table.update().where(pk_column == bindparam("new_" + pk_column_name))
+        expr = expr.values(
+            **{
+                k: bindparam("new_" + k)
+                for k in columns
+                if k != pk_column_name and k in table_columns
+            }
+        )
+        # databases bind params only where query is passed as string
+        # otherwise it just passes all data to values and results in unconsumed columns
+        return str(expr)
+
     async def bulk_update(  # noqa:  CCR001
         self, objects: List["T"], columns: Optional[List[str]] = None
     ) -> None:
@@ -1205,20 +1520,17 @@ class QuerySet(Generic[T]):
         if not objects:
             raise ModelListEmptyError("Bulk update objects are empty!")
 
-        ready_objects = []
-        pk_name = self.model_config.pkname
-        if not columns:
-            columns = list(
-                self.model.extract_db_own_fields().union(
-                    self.model.extract_related_names()
-                )
-            )
-
+        pk_name = self._pkname
+        # copy to not modify the list passed by the caller
+        columns = list(columns) if columns else list(self._self_fields)
         if pk_name not in columns:
             columns.append(pk_name)
 
         columns = [self.model.get_column_alias(k) for k in columns]
+        # bind params of the update statement are prefixed with new_
+        rename_pairs = tuple((k, "new_" + k) for k in dict.fromkeys(columns))
 
+        ready_objects = []
         for obj in objects:
             new_kwargs = obj.model_dump()
             if new_kwargs.get(pk_name) is None:
@@ -1228,27 +1540,15 @@ class QuerySet(Generic[T]):
                 )
             new_kwargs = obj.prepare_model_to_update(new_kwargs)
             ready_objects.append(
-                {"new_" + k: v for k, v in new_kwargs.items() if k in columns}
+                {dst: new_kwargs[src] for src, dst in rename_pairs if src in new_kwargs}
             )
             await asyncio.sleep(0)
 
-        pk_column = self.model_config.table.c.get(self.model.get_column_alias(pk_name))
-        pk_column_name = self.model.get_column_alias(pk_name)
-        table_columns = [c.name for c in self.model_config.table.c]
-        expr = self.table.update().where(
-            pk_column == bindparam("new_" + pk_column_name)
-        )
-        expr = expr.values(
-            **{
-                k: bindparam("new_" + k)
-                for k in columns
-                if k != pk_column_name and k in table_columns
-            }
-        )
-        # databases bind params only where query is passed as string
-        # otherwise it just passes all data to values and results in unconsumed columns
-        expr = str(expr)
-        await self.database.execute_many(expr, ready_objects)
+        expr = self._build_bulk_update_expression(self.model, tuple(columns))
+        # databases executes each row separately, so wrap them in one transaction
+        # to commit once instead of after each single update statement
+        async with self._database.transaction():
+            await self._database.execute_many(expr, ready_objects)
 
         for obj in objects:
             obj.set_save_status(True)
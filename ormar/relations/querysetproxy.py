@@ -281,9 +281,7 @@ class QuerysetProxy(Generic[T]):
         self._clean_items_on_load()
         if keep_reversed and self.type_ == ormar.RelationType.REVERSE:
             update_kwrgs = {f"{owner_column}": None}
-            return await queryset.filter(_exclude=False, **kwargs).update(
-                each=False, **update_kwrgs
-            )
+            return await queryset.filter(**kwargs).update(each=False, **update_kwrgs)
         return await queryset.delete(**kwargs)  # type: ignore
 
     async def values(
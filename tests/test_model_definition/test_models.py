@@ -193,6 +193,27 @@ async def test_binary_column():
             assert items[0].test_binary == b"test2icac89uc98"
 
 
+@pytest.mark.asyncio
+async def test_binary_column_bulk_operations():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await LargeBinarySample.objects.bulk_create(
+                [
+                    LargeBinarySample(test_binary="test"),
+                    LargeBinarySample(test_binary=blob2),
+                ]
+            )
+            items = await LargeBinarySample.objects.all()
+            assert len(items) == 2
+            assert items[0].test_binary == blob
+            assert items[1].test_binary == blob2
+
+            items[0].test_binary = "test2icac89uc98"
+            await LargeBinarySample.objects.bulk_update(items)
+            items = await LargeBinarySample.objects.all()
+            assert items[0].test_binary == blob2
+
+
 @pytest.mark.asyncio
 async def test_binary_str_column():
     async with base_ormar_config.database:
@@ -327,6 +348,34 @@ async def test_model_get():
             assert await User.objects.order_by("-name").get() == user
 
 
+@pytest.mark.asyncio
+async def test_model_get_by_pk():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            user = await User.objects.create(name="Tom")
+            await User.objects.create(name="Jane")
+
+            assert await User.objects.get(pk=user.pk) == user
+            assert await User.objects.get(id=user.pk) == user
+            assert await User.objects.get(pk=user) == user
+            assert await User.objects.get_or_none(pk=user.pk + 10) is None
+            with pytest.raises(ormar.NoMatch):
+                await User.objects.get(pk=user.pk + 10)
+            with pytest.raises(ormar.NoMatch):
+                await User.objects.filter(name="Jane").get(pk=user.pk)
+            with pytest.raises(ormar.NoMatch):
+                await User.objects.exclude(name="Tom").get(pk=user.pk)
+
+            partial = await User.objects.fields("id").get(pk=user.pk)
+            assert partial.pk == user.pk
+            assert partial.name is None
+            partial = await User.objects.exclude_fields("name").get(pk=user.pk)
+            assert partial.name is None
+
+            user2 = await User2.objects.create(id="abc", name="Lucy")
+            assert await User2.objects.get(pk="abc") == user2
+
+
 @pytest.mark.asyncio
 async def test_model_filter():
     async with base_ormar_config.database:
@@ -398,6 +447,54 @@ async def test_model_exists():
             await User.objects.create(name="Tom")
             assert await User.objects.filter(name="Tom").exists() is True
             assert await User.objects.filter(name="Jane").exists() is False
+            assert await User.objects.exclude(name="Tom").exists() is False
+            assert await User.objects.offset(1).exists() is False
+
+
+@pytest.mark.asyncio
+async def test_model_chained_exclude():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            for name in ["Tom", "Tim", "Jane"]:
+                await User.objects.create(name=name)
+
+            # each exclude call is negated separately
+            users = (
+                await User.objects.exclude(name="Tom")
+                .exclude(name="Jane")
+                .order_by("name")
+                .all()
+            )
+            assert [user.name for user in users] == ["Tim"]
+
+            users = (
+                await User.objects.exclude(name__icontains="o")
+                .exclude(name__icontains="m")
+                .all()
+            )
+            assert [user.name for user in users] == ["Jane"]
+
+            # conditions passed to one exclude call are negated together
+            users = (
+                await User.objects.exclude(name__startswith="T", name__icontains="o")
+                .order_by("name")
+                .all()
+            )
+            assert [user.name for user in users] == ["Jane", "Tim"]
+
+            users = (
+                await User.objects.exclude(
+                    ormar.or_(name="Tom", name__icontains="ane"), name__startswith="T"
+                )
+                .exclude(name="Jane")
+                .all()
+            )
+            assert [user.name for user in users] == ["Tim"]
+
+            users = (
+                await User.objects.filter(name__icontains="m").exclude(name="Tom").all()
+            )
+            assert [user.name for user in users] == ["Tim"]
 
 
 @pytest.mark.asyncio
@@ -409,7 +506,11 @@ async def test_model_count():
             await User.objects.create(name="Lucy")
 
             assert await User.objects.count() == 3
+            assert await User.objects.count(distinct=False) == 3
             assert await User.objects.filter(name__icontains="T").count() == 1
+            assert await User.objects.exclude(name="Tom").count() == 2
+            assert await User.objects.limit(2).count() == 2
+            assert await User.objects.offset(1).count() == 2
 
 
 @pytest.mark.asyncio
@@ -68,3 +68,41 @@ async def test_model_creation():
             if Product.db_backend_name() != "postgresql":
                 # postgres use transaction timestamp so it will remain the same
                 assert p1.created != p2.created  # pragma nocover
+
+
+@pytest.mark.asyncio
+async def test_server_defaults_reloaded_without_returning(monkeypatch):
+    monkeypatch.setattr(Product, "_database_supports_returning", lambda self: False)
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            product = await Product(name="Test").save()
+            assert product.created is not None
+            assert product.company == "Acme"
+            assert product.sort_order == 10
+            assert product.saved
+
+
+@pytest.mark.asyncio
+async def test_server_defaults_taken_from_returning(monkeypatch):
+    created = datetime.strptime("2020-10-27 11:30", "%Y-%m-%d %H:%M")
+    queries = []
+
+    async def fetch_one(query, values=None):
+        queries.append(query)
+        return dict(id=1, name="Test", company="Acme", sort_order=10, created=created)
+
+    monkeypatch.setattr(Product, "_database_supports_returning", lambda self: True)
+    monkeypatch.setattr(base_ormar_config.database, "fetch_one", fetch_one)
+    product = await Product(name="Test").save()
+    assert [column.name for column in queries[0]._returning] == [
+        "id",
+        "name",
+        "company",
+        "sort_order",
+        "created",
+    ]
+    assert product.pk == 1
+    assert product.created == created
+    assert product.company == "Acme"
+    assert product.sort_order == 10
+    assert product.saved
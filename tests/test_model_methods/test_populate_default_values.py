@@ -35,3 +35,29 @@ def test_populate_default_values():
     assert result["name"] == ""
     assert result["points"] == 0
     assert result["score"] == 5
+
+
+def test_populate_default_values_clears_empty_server_defaults():
+    result = Task.populate_default_values({"name": None})
+
+    assert "name" not in result
+    assert result["points"] == 0
+    assert result["score"] == 5
+    assert Task._default_providers is not None
+    assert [name for name, _ in Task._default_providers] == ["points", "score"]
+    assert Task._server_default_names == ("name", "points")
+
+
+def test_prepare_model_to_save():
+    result = Task.prepare_model_to_save({"id": None, "name": None, "not_field": 1})
+
+    assert result == {"points": 0, "score": 5}
+    assert Task._pk_removable
+    assert Task._alias_pairs == ()
+    assert Task._bytes_parsers == ()
+    assert Task.prepare_model_to_save({"id": 1, "name": "Task"}) == {
+        "id": 1,
+        "name": "Task",
+        "points": 0,
+        "score": 5,
+    }
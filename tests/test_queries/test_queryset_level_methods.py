@@ -78,6 +78,16 @@ class QuerySetCls(QuerySet):
         return entity
 
 
+class SlottedQuerySetCls(QuerySet):
+    __slots__ = ("custom_slot", "__private_slot", "__weakref__")
+
+    def set_private_slot(self, value):
+        self.__private_slot = value
+
+    def get_private_slot(self):
+        return self.__private_slot
+
+
 class Customer(ormar.Model):
     ormar_config = base_ormar_config.copy(
         tablename="customer",
@@ -358,7 +368,9 @@ async def test_bulk_update_with_only_selected_columns():
             todo.text = todo.text + "_1"
             todo.completed = False
 
-        await ToDo.objects.bulk_update(todoes, columns=["completed"])
+        columns = ["completed"]
+        await ToDo.objects.bulk_update(todoes, columns=columns)
+        assert columns == ["completed"]
 
         completed = await ToDo.objects.filter(completed=False).all()
         assert len(completed) == 2
@@ -370,6 +382,30 @@ async def test_bulk_update_with_only_selected_columns():
             assert todo.text[-2:] != "_1"
 
 
+@pytest.mark.asyncio
+async def test_bulk_update_reuses_cached_statement():
+    async with base_ormar_config.database:
+        await ToDo.objects.bulk_create(
+            [
+                ToDo(text="Reset the world simulation.", completed=False),
+                ToDo(text="Watch kittens.", completed=True),
+            ]
+        )
+        todoes = await ToDo.objects.all()
+
+        build_expression = QuerySet._build_bulk_update_expression
+        await ToDo.objects.bulk_update(todoes, columns=["text"])
+        hits = build_expression.cache_info().hits
+        for todo in todoes:
+            todo.text = todo.text + "_2"
+        await ToDo.objects.bulk_update(todoes, columns=["text"])
+        assert build_expression.cache_info().hits == hits + 1
+
+        todoes = await ToDo.objects.all()
+        for todo in todoes:
+            assert todo.text[-2:] == "_2"
+
+
 @pytest.mark.asyncio
 async def test_bulk_update_with_relation():
     async with base_ormar_config.database:
@@ -460,6 +496,51 @@ async def test_custom_queryset_cls():
         c = await Customer.objects.first_or_404(name="test")
         assert c.name == "test"
 
+        queryset = Customer.objects
+        queryset.custom_attribute = "custom"
+        chained = queryset.filter(name="test").limit(1).order_by("name")
+        assert isinstance(chained, QuerySetCls)
+        assert chained.custom_attribute == "custom"
+        assert chained.limit_count == 1
+        assert queryset.limit_count is None
+        assert not queryset.filter_clauses
+        c = await chained.first_or_404()
+        assert c.name == "test"
+
+
+def test_custom_queryset_cls_with_slots():
+    queryset = SlottedQuerySetCls(model_cls=Book)
+    queryset.custom_slot = "custom"
+    queryset.set_private_slot("private")
+    chained = queryset.filter(title="test").limit(2)
+    assert isinstance(chained, SlottedQuerySetCls)
+    assert chained.custom_slot == "custom"
+    assert chained.get_private_slot() == "private"
+    assert chained.limit_count == 2
+    assert not hasattr(SlottedQuerySetCls(model_cls=Book).limit(1), "custom_slot")
+
+
+def test_rebuild_self_keeps_not_passed_values():
+    queryset = Note.objects.filter(text="test").limit(2).offset(1)
+    rebuilt = queryset.rebuild_self(limit_count=5)
+    assert rebuilt is not queryset
+    assert rebuilt.limit_count == 5
+    assert rebuilt.query_offset == 1
+    assert rebuilt.filter_clauses == queryset.filter_clauses
+    assert queryset.limit_count == 2
+
+    rebuilt = queryset.rebuild_self(offset=3, select_related=["category"])
+    assert rebuilt.query_offset == 3
+    assert rebuilt._select_related == ["category"]
+    assert rebuilt.limit_count == 2
+
+
+def test_queryset_config_shortcuts():
+    queryset = Book.objects
+    assert queryset.model_config is Book.ormar_config
+    assert queryset.database is Book.ormar_config.database
+    assert queryset.table is Book.ormar_config.table
+
 
 @pytest.mark.asyncio
 async def test_filter_enum():
@@ -3,6 +3,7 @@ from typing import Optional
 import ormar
 import pytest
 from ormar.exceptions import MultipleMatches, NoMatch, RelationshipInstanceError
+from ormar.queryset import QuerySet
 
 from tests.lifespan import init_tests
 from tests.settings import create_config
@@ -146,6 +147,16 @@ async def test_select_related():
             tracks = await Track.objects.select_related("album").all()
             assert len(tracks) == 6
 
+            expr = (
+                Track.objects.select_related("album")
+                .filter(title="The Bird")
+                .build_select_expression()
+            )
+            row = await base_ormar_config.database.fetch_one(expr)
+            track = Track.from_row(row, select_related=["album"], source_model=Track)
+            assert track.title == "The Bird"
+            assert track.album.name == "Malibu"
+
 
 @pytest.mark.asyncio
 async def test_model_removal_from_relations():
@@ -274,6 +285,25 @@ async def test_multiple_fk():
             for member in members:
                 assert member.team.org.ident == "ACME Ltd"
 
+            organisations = (
+                await Organisation.objects.select_related("teams__members")
+                .order_by(["teams__name", "teams__members__email"])
+                .all()
+            )
+            assert len(organisations) == 2
+            assert len(organisations[0].teams) == 2
+            assert [m.email for m in organisations[0].teams[0].members] == [
+                "c@example.org",
+                "d@example.org",
+            ]
+
+
+def test_only_to_many_joins_require_merging():
+    assert not QuerySet._joins_to_many_relations(Member, ())
+    assert not QuerySet._joins_to_many_relations(Member, ("team__org",))
+    assert QuerySet._joins_to_many_relations(Organisation, ("teams",))
+    assert QuerySet._joins_to_many_relations(Member, ("team__org__teams",))
+
 
 @pytest.mark.asyncio
 async def test_pk_filter():
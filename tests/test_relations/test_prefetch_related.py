@@ -153,6 +153,14 @@ async def test_prefetch_related():
             tracks = await Track.objects.prefetch_related("album").all()
             assert len(tracks) == 6
 
+            album = await Album.objects.prefetch_related("tracks").first()
+            assert album.name == "Malibu"
+            assert len(album.tracks) == 3
+
+            album = await Album.objects.prefetch_related("cover_pictures").get()
+            assert album.name == "Fantasies"
+            assert len(album.cover_pictures) == 2
+
 
 @pytest.mark.asyncio
 async def test_prefetch_related_with_many_to_many():